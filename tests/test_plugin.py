@@ -9,24 +9,36 @@ import json
 import os
 import sys
 
+# Repository root, so tests resolve paths without changing the working directory
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def repo_path(path):
+    """Resolve a repository-relative path against REPO_ROOT"""
+    return os.path.join(REPO_ROOT, path)
+
+def load_json(path, description):
+    """Open and parse a JSON file in one pass, failing if it is missing"""
+    try:
+        with open(repo_path(path), 'r') as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        raise AssertionError(f"{description} not found: {path}")
+    print(f"✓ {description} exists: {path}")
+    print(f"✓ Valid JSON")
+    return data
+
 def test_model_files():
     """Test model JSON file exists and is valid"""
     print("\n=== Testing Model Files ===")
 
-    # Check file exists
-    model_path = '.fz/models/Moret.json'
-    assert os.path.exists(model_path), f"Model file not found: {model_path}"
-    print(f"✓ Model file exists: {model_path}")
-
-    # Check valid JSON
-    with open(model_path, 'r') as f:
-        model = json.load(f)
-    print(f"✓ Valid JSON")
+    # Check file exists and is valid JSON
+    model = load_json('.fz/models/Moret.json', 'Model file')
 
     # Check required fields
     required_fields = ['id', 'varprefix', 'delim', 'commentline', 'output']
+    missing = set(required_fields) - model.keys()
+    assert not missing, f"Missing required fields: {sorted(missing)}"
     for field in required_fields:
-        assert field in model, f"Missing required field: {field}"
         print(f"✓ Has field '{field}': {model[field] if field != 'output' else f'{len(model[field])} outputs'}")
 
     # Check output variables
@@ -39,19 +51,12 @@ def test_calculator_files():
     """Test calculator JSON file exists and is valid"""
     print("\n=== Testing Calculator Files ===")
 
-    # Check file exists
-    calc_path = '.fz/calculators/localhost_Moret.json'
-    assert os.path.exists(calc_path), f"Calculator file not found: {calc_path}"
-    print(f"✓ Calculator file exists: {calc_path}")
-
-    # Check valid JSON
-    with open(calc_path, 'r') as f:
-        calc = json.load(f)
-    print(f"✓ Valid JSON")
+    # Check file exists and is valid JSON
+    calc = load_json('.fz/calculators/localhost_Moret.json', 'Calculator file')
 
     # Check required fields
-    assert 'uri' in calc, "Missing 'uri' field"
-    assert 'models' in calc, "Missing 'models' field"
+    missing = {'uri', 'models'} - calc.keys()
+    assert not missing, f"Missing required fields: {sorted(missing)}"
     print(f"✓ Has field 'uri': {calc['uri']}")
     print(f"✓ Has field 'models': {list(calc['models'].keys())}")
 
@@ -61,18 +66,20 @@ def test_calculator_scripts():
     """Test calculator script exists and is executable"""
     print("\n=== Testing Calculator Scripts ===")
 
-    # Check file exists
+    # Check file exists (opening it is the existence check)
     script_path = '.fz/calculators/Moret.sh'
-    assert os.path.exists(script_path), f"Calculator script not found: {script_path}"
+    try:
+        with open(repo_path(script_path), 'r') as f:
+            first_line = f.readline().strip()
+    except FileNotFoundError:
+        raise AssertionError(f"Calculator script not found: {script_path}")
     print(f"✓ Calculator script exists: {script_path}")
 
     # Check executable
-    assert os.access(script_path, os.X_OK), f"Script not executable: {script_path}"
+    assert os.access(repo_path(script_path), os.X_OK), f"Script not executable: {script_path}"
     print(f"✓ Script is executable")
 
     # Check shebang
-    with open(script_path, 'r') as f:
-        first_line = f.readline().strip()
     assert first_line.startswith('#!/'), "Script missing shebang"
     print(f"✓ Has shebang: {first_line}")
 
@@ -82,14 +89,16 @@ def test_example_files():
     """Test example files exist"""
     print("\n=== Testing Example Files ===")
 
-    # Check example file exists
+    # Check example file exists (opening it is the existence check)
     example_path = 'examples/Moret/godiva.m5'
-    assert os.path.exists(example_path), f"Example file not found: {example_path}"
+    try:
+        with open(repo_path(example_path), 'r') as f:
+            content = f.read()
+    except FileNotFoundError:
+        raise AssertionError(f"Example file not found: {example_path}")
     print(f"✓ Example file exists: {example_path}")
 
     # Check file has content
-    with open(example_path, 'r') as f:
-        content = f.read()
     assert len(content) > 0, "Example file is empty"
     assert 'MORET_BEGIN' in content, "Example file missing MORET_BEGIN marker"
     print(f"✓ Example file has valid MORET format")
@@ -109,7 +118,7 @@ def test_with_fz():
         print(f"✓ fz module imported successfully")
 
         # Test variable parsing
-        example_path = 'examples/Moret/godiva.m5'
+        example_path = repo_path('examples/Moret/godiva.m5')
         variables = fz.fzi(example_path, 'Moret')
         print(f"✓ fz.fzi() works, found variables: {list(variables.keys())}")
 
@@ -158,11 +167,6 @@ def main():
     print("Moret Plugin Test Suite")
     print("=" * 60)
 
-    # Change to repository root if needed
-    if os.path.exists('tests') and os.path.basename(os.getcwd()) == 'tests':
-        os.chdir('..')
-        print(f"Changed directory to: {os.getcwd()}")
-
     failed = False
 
     # Run all tests